@@ -99,6 +99,9 @@ class BoundaryHandler(ABC, HasBounds):
     def __call__(self, position: Position) -> Position:
         """Apply the selected strategy to the position-matrix given the bounds
 
+        Strategies are free to repair the positions in place and return the
+        input array.
+
         Parameters
         ----------
         position : numpy.ndarray
@@ -181,6 +184,8 @@ class NearestHandler(BoundaryHandler):
     """
 
     def __call__(self, position: Position):
+        if np.can_cast(np.result_type(position, self.lb, self.ub), position.dtype):
+            return np.clip(position, self.lb, self.ub, out=position)
         return np.clip(position, self.lb, self.ub)
 
 
@@ -343,7 +348,13 @@ class PeriodicHandler(BoundaryHandler):
     """
 
     def __call__(self, position: Position):
-        return self.lb + (position - self.lb) % self.width
+        if not np.can_cast(np.result_type(position, self.lb, self.width), position.dtype):
+            return self.lb + (position - self.lb) % self.width
+
+        np.subtract(position, self.lb, out=position)
+        np.mod(position, self.width, out=position)
+        np.add(position, self.lb, out=position)
+        return position
 
 
 class VelocityHandler(ABC):
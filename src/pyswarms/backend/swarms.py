@@ -14,6 +14,7 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 
+from pyswarms.backend import _kernels
 from pyswarms.utils.types import Position, Velocity
 
 
@@ -100,7 +101,7 @@ class Swarm:
         self.dimensions = self.position.shape[1]
 
         if not self.pbest_pos.size:
-            self.pbest_pos = self.position
+            self.pbest_pos = self.position.copy()
 
     def compute_pbest(self):
         """Update the personal best score of a swarm instance
@@ -127,13 +128,15 @@ class Swarm:
         best, then the current position replaces the previous personal best
         position.
         """
-        # Infer dimensions from positions
-        dimensions = self.dimensions
+        if _kernels.can_use_kernels(self.position, self.pbest_pos, self.current_cost, self.pbest_cost):
+            _kernels.update_pbest(self.position, self.pbest_pos, self.current_cost, self.pbest_cost)
+            return
 
-        # Create a 1-D and 2-D mask based from comparisons
+        # Create a 1-D mask based on the cost comparison. The mask is
+        # broadcast over the position rows so the 2-D mask never has to be
+        # materialized.
         mask_cost = self.current_cost < self.pbest_cost
-        mask_pos = np.repeat(mask_cost[:, np.newaxis], dimensions, axis=1)
 
-        # Apply masks
-        self.pbest_pos = np.where(~mask_pos, self.pbest_pos, self.position)
-        self.pbest_cost = np.where(~mask_cost, self.pbest_cost, self.current_cost)
+        # Apply mask
+        np.copyto(self.pbest_pos, self.position, where=mask_cost[:, np.newaxis])
+        self.pbest_cost = np.minimum(self.current_cost, self.pbest_cost)
@@ -135,7 +135,8 @@ class BaseSwarmOptimizer(abc.ABC):
         self.cost_history.append(self.swarm.best_cost)
         self.mean_pbest_history.append(float(np.mean(self.swarm.pbest_cost)))
         self.mean_neighbor_history.append(self.swarm.best_cost)
-        self.pos_history.append(self.swarm.position)
+        # The position matrix is updated in place, so store a snapshot
+        self.pos_history.append(self.swarm.position.copy())
         self.velocity_history.append(self.swarm.velocity)
 
     def optimize(